@@ -0,0 +1,64 @@
+"""Benchmark ldata operations with and without copy on write.
+
+Reports wall time and peak traced memory of construction, subset, transpose,
+concat and setter calls on a simulated ldata object.
+
+Usage: python benchmarks/copy_on_write.py [nfeatures] [nsamples]
+"""
+
+import sys
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+from pydata.ldata import ldata
+from pydata.options import option_context
+
+
+def simulate(nfeatures, nsamples):
+    data = pd.DataFrame(
+        np.random.default_rng(38).uniform(size=(nfeatures, nsamples)),
+        index=["Feature" + str(i) for i in range(1, nfeatures + 1)],
+        columns=["Sample" + str(i) for i in range(1, nsamples + 1)],
+    )
+    desc = pd.DataFrame({"ID": data.columns})
+    annot = pd.DataFrame({"ID": data.index})
+    return data, desc, annot
+
+
+def measure(f):
+    tracemalloc.start()
+    start = time.perf_counter()
+    f()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 1e6
+
+
+def run(nfeatures, nsamples):
+    data, desc, annot = simulate(nfeatures, nsamples)
+    x = ldata(data, desc, annot)
+    half = x.colnames[: nsamples // 2]
+    ops = {
+        "construct": lambda: ldata(data, desc, annot),
+        "subset": lambda: x.subset(samples=half),
+        "transpose": lambda: x.transpose(),
+        "concat": lambda: x.subset(samples=half).concat(
+            x.subset(samples=x.colnames[nsamples // 2 :])
+        ),
+        "rownames": lambda: setattr(x.transpose(), "colnames", x.rownames),
+    }
+    print(f"{nfeatures} features x {nsamples} samples")
+    print(f"{'operation':<12}{'mode':<16}{'time (s)':>10}{'peak (MB)':>12}")
+    for name, f in ops.items():
+        for cow in [False, True]:
+            with option_context("copy_on_write", cow):
+                elapsed, peak = measure(f)
+            mode = "copy_on_write" if cow else "copy"
+            print(f"{name:<12}{mode:<16}{elapsed:>10.3f}{peak:>12.1f}")
+
+
+if __name__ == "__main__":
+    args = [int(i) for i in sys.argv[1:3]]
+    run(*(args or [50000, 200]))
@@ -1 +1 @@
-__version__ = "0.0.0.9001"
+__version__ = "0.0.0.9002"
@@ -0,0 +1,121 @@
+import os
+import json
+import pickle
+import hashlib
+from collections import OrderedDict
+from pydata.options import get_option
+
+_results = OrderedDict()
+_sizes = {}
+
+
+def result_key(type: str, data, kwargs: dict):
+    """Key of a dimension reduction result.
+
+    Parameters
+    ----------
+    type: str
+        Type of dimension reduction.
+    data: ldata object
+        Data the dimension reduction is performed on.
+    kwargs: dict
+        Arguments of the dimension reduction.
+
+    Returns
+    ----------
+    str of hexadecimal digest.
+    """
+    args = json.dumps(kwargs, sort_keys=True, default=repr)
+    return hashlib.sha1(f"{type}|{args}|{data._content_hash()}".encode()).hexdigest()
+
+
+def get_result(key: str):
+    """Get cached dimension reduction result.
+
+    Looks up the in memory cache and then the "result_cache_dir" directory,
+    moving results found on disk into memory.
+
+    Parameters
+    ----------
+    key: str
+        Key from result_key.
+
+    Returns
+    ----------
+    Cached result or None.
+    """
+    if key in _results:
+        _results.move_to_end(key)
+        return _results[key]
+    path = _result_path(key)
+    if path is None or not os.path.isfile(path):
+        return None
+    with open(path, "rb") as f:
+        value = f.read()
+    out = pickle.loads(value)
+    _store(key, out, len(value))
+    return out
+
+
+def put_result(key: str, result):
+    """Cache dimension reduction result.
+
+    Results are kept in memory up to "result_cache_memory" bytes, evicting
+    the least recently used results, and are also written to the
+    "result_cache_dir" directory if set.
+
+    Parameters
+    ----------
+    key: str
+        Key from result_key.
+    result:
+        Dimension reduction result.
+    """
+    value = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+    path = _result_path(key)
+    if path is not None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(value)
+    _store(key, result, len(value))
+
+
+def clear_cache(disk: bool = False):
+    """Clear cached dimension reduction results.
+
+    Parameters
+    ----------
+    disk: bool
+        Whether to also remove results in the "result_cache_dir" directory.
+        Default is False.
+
+    Examples
+    ----------
+    >>> clear_cache()
+    """
+    _results.clear()
+    _sizes.clear()
+    path = get_option("result_cache_dir")
+    if disk and path is not None and os.path.isdir(path):
+        for i in os.listdir(path):
+            if i.endswith(".pkl"):
+                os.remove(os.path.join(path, i))
+
+
+def _store(key: str, result, size: int):
+    limit = get_option("result_cache_memory")
+    if size > limit:
+        return
+    _results[key] = result
+    _sizes[key] = size
+    _results.move_to_end(key)
+    while sum(_sizes.values()) > limit:
+        old, _ = _results.popitem(last=False)
+        del _sizes[old]
+
+
+def _result_path(key: str):
+    path = get_option("result_cache_dir")
+    if path is None:
+        return None
+    return os.path.join(path, key + ".pkl")
@@ -2,6 +2,8 @@ from pydata.ldata import ldata
 import re
 from copy import deepcopy
 import pandas as pd
+import numpy as np
+import scipy.sparse as sp
 from sklearn.preprocessing import StandardScaler
 import seaborn as sns
 import plotly.express as px
@@ -13,7 +15,7 @@ class drdata(ldata):
     Class to store results from a dimension reduction analysis
     """
 
-    def __init__(self, data, description, annotation, scaling=None):
+    def __init__(self, data, description, annotation, scaling=None, validation=None):
         """
         Parameters
         ----------
@@ -27,11 +29,14 @@ class drdata(ldata):
             A DataFrame of reduce dimensions annotation
         scaling: str
             String describing the scaling procedure used before PCA e.g. "None", "zscore".
+        validation: str
+            Level of validation. Either "full", "fast" or "off". Default is
+            the pydata "validation" option.
         """
 
-        super().__init__(data, description, annotation)
+        super().__init__(data, description, annotation, validation)
         self._scaling = scaling
-        self._validate()
+        self._validate(validation)
 
     def __str__(self):
         out = super().__str__()
@@ -72,6 +77,25 @@ class drdata(ldata):
 
     scaling = property(_get_scaling, _set_scaling)
 
+    def _get_scaler(self):
+        return getattr(self, "_scaler", None)
+
+    def _set_scaler(self, value):
+        self._scaler = value
+
+    scaler = property(_get_scaler, _set_scaler)
+
+    def _get_model(self):
+        return getattr(self, "_model", None)
+
+    def _set_model(self, value):
+        self._model = value
+
+    model = property(_get_model, _set_model)
+
+    def _metadata(self):
+        return {**super()._metadata(), "scaling": self.scaling}
+
     @staticmethod
     def scale(data: ldata, method: str = "none", **kwargs):
         """Scale ldata object
@@ -82,30 +106,153 @@ class drdata(ldata):
         method: Scaling method. Options: "none", "zscore". Default is "none".
         **kwargs: Passed to methods.
 
+        Sparse ldata objects are scaled without centering to keep data sparse,
+        so "zscore" scales features to unit variance only.
+
         Returns
         ---------
-        pd.DataFrame of scaled data.
+        pd.DataFrame of scaled data or scipy.sparse.csr_matrix for sparse
+        ldata objects.
         """
+        return drdata._fit_scale(data, method)[0]
+
+    @staticmethod
+    def _scale(data: ldata, method: str = "none"):
+        """Scale ldata object, returning scaled data and fitted scaler.
+
+        Uses the scaling cache of pydata objects where available. Returned
+        data may be shared between dimension reductions so must not be
+        modified.
+        """
+        if hasattr(data, "_scaled"):
+            return data._scaled(method)
+        return drdata._fit_scale(data, method)
+
+    @staticmethod
+    def _fit_scale(data: ldata, method: str = "none"):
+        if data.is_sparse:
+            dat = data._matrix().T.tocsr()
+            match method:
+                case "none":
+                    return dat, None
+                case "zscore":
+                    scaler = StandardScaler(with_mean=False)
+                    return scaler.fit_transform(dat), scaler
+                case _:
+                    raise Exception(method + " scaling method not implemented")
         dat = deepcopy(data.data.transpose())
+        scaler = None
         match method:
             case "none":
                 dat = dat
             case "zscore":
+                scaler = StandardScaler()
                 dat = pd.DataFrame(
-                    StandardScaler().fit_transform(dat),
+                    scaler.fit_transform(dat),
                     index=data.colnames,
                     columns=data.rownames,
                 )
             case _:
                 raise Exception(method + " scaling method not implemented")
-        return dat
+        return dat, scaler
 
-    def _validate(self):
-        t = super()._format_type().upper()
-        assert all(
-            [bool(re.search(f"^{t}\\d+", i)) for i in self.rownames]
-        ), f"rownames must be in format {t}1, {t}2, etc"
-        super()._validate()
+    @staticmethod
+    def _batch_scaler(data: ldata, method: str, batch_size: int):
+        """Fit scaler to ldata object one batch of samples at a time.
+
+        Returns fitted sklearn.preprocessing.StandardScaler or None for no
+        scaling.
+        """
+        match method:
+            case "none":
+                return None
+            case "zscore":
+                scaler = StandardScaler()
+                for x in data._sample_batches(batch_size):
+                    scaler.partial_fit(x)
+                return scaler
+            case _:
+                raise Exception(method + " scaling method not implemented")
+
+    def transform(self, data: ldata):
+        """Project new samples onto drdata object.
+
+        Uses the scaler and model fitted by analyse. Fitted scalers and models
+        are not saved by ldata.save so are not available for loaded objects.
+
+        Parameters
+        ----------
+        data: ldata object
+            ldata object of new samples with the same features as the data
+            used to fit the model.
+
+        Returns
+        ----------
+        drdata object of the same type with new samples added.
+
+        Examples
+        ----------
+        >>> x = pydata.example_pydata()
+        >>> pcs = pca.analyse(x.subset(samples=x.colnames[:100]))
+        >>> pcs.transform(x.subset(samples=x.colnames[100:]))
+        """
+        self._validate()
+        t = super()._format_type()
+        assert self.model is not None, f"{t} object has no fitted model"
+        features = getattr(self, "_features")
+        assert data._index().equals(
+            features
+        ), "data must have same features as fitted data"
+        assert (
+            not self._columns().isin(data._columns()).any()
+        ), f"data samples are already in {t} object"
+        dat = data._matrix().T
+        if getattr(self, "_sparse"):
+            dat = sp.csr_matrix(dat)
+        elif sp.issparse(dat):
+            dat = dat.toarray()
+        if self.scaler is not None:
+            dat = self._apply(self.scaler, dat, data._columns(), features)
+        dat = self._apply(self.model, dat, data._columns(), features)
+        new = pd.DataFrame(
+            np.asarray(dat).T, index=self._index(), columns=data._columns()
+        )
+        out = self._copy(
+            data=pd.concat([self.data, new], axis=1),
+            description=pd.concat([self.description, data.description]).reset_index(
+                drop=True
+            ),
+        )
+        out._validate()
+        return out
+
+    def _fitted(self, scaler, model, features: pd.Index, sparse: bool = False):
+        """Keep fitted scaler and model for transform.
+
+        sparse indicates whether the scaler and model were fitted to sparse
+        data.
+        """
+        self._scaler = scaler
+        self._model = model
+        self._features = features
+        self._sparse = sparse
+        return self
+
+    @staticmethod
+    def _apply(estimator, x, index, columns):
+        # Match the input type the estimator was fitted with
+        if hasattr(estimator, "feature_names_in_"):
+            x = pd.DataFrame(x, index=index, columns=columns)
+        return estimator.transform(x)
+
+    def _validate(self, level: str = None):
+        level = self._validation_level(level)
+        if level == "full":
+            t = super()._format_type().upper()
+            assert (
+                self._index().str.match(f"{t}\\d+").all()
+            ), f"rownames must be in format {t}1, {t}2, etc"
+        super()._validate(level)
 
     def subset(self):
         raise Exception(f"Cannot subset {super()._format_type()} object")
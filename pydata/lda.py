@@ -2,6 +2,7 @@ from pydata.ldata import ldata
 from pydata.drdata import drdata
 import re
 import pandas as pd
+import scipy.sparse as sp
 from sklearn.discriminant_analysis import LinearDiscriminantAnalysis
 from copy import deepcopy
 
@@ -11,7 +12,15 @@ class lda(drdata):
     Perform and store results from linear discriminant analysis (LDA)
     """
 
-    def __init__(self, data, description, annotation, scaling=None, target=None):
+    def __init__(
+        self,
+        data,
+        description,
+        annotation,
+        scaling=None,
+        target=None,
+        validation=None,
+    ):
         """
         Parameters
         ----------
@@ -25,9 +34,12 @@ class lda(drdata):
             A DataFrame of LDA components annotation
         target: str
             String describing target variable for LDA calculations
+        validation: str
+            Level of validation. Either "full", "fast" or "off". Default is
+            the pydata "validation" option.
         """
 
-        super().__init__(data, description, annotation, scaling)
+        super().__init__(data, description, annotation, scaling, validation)
         self._target = target
 
     def __str__(self):
@@ -46,6 +58,9 @@ class lda(drdata):
 
     target = property(_get_target, _set_target)
 
+    def _metadata(self):
+        return {**super()._metadata(), "target": self.target}
+
     def plot(self, colour_by=None, **kwargs):
         if colour_by is None:
             colour_by = self.target
@@ -79,7 +94,9 @@ class lda(drdata):
         """
         assert target in data.description.columns, target + " is not in description"
         target_df = deepcopy(data.description[target])
-        dat = drdata.scale(data=data, method=scaling)
+        dat, scaler = drdata._scale(data=data, method=scaling)
+        if sp.issparse(dat):
+            dat = dat.toarray()
         l = LinearDiscriminantAnalysis(n_components=n_comp, **kwargs)
         fit = l.fit(dat, target_df).transform(dat)
         fit = pd.DataFrame(fit, columns=["LDA" + str(i) for i in range(1, n_comp + 1)])
@@ -91,4 +108,4 @@ class lda(drdata):
             target=target,
             scaling=scaling,
         )
-        return out
+        return out._fitted(scaler, l, data._index())
@@ -1,8 +1,17 @@
 import pandas as pd
 import numpy as np
-from copy import deepcopy
+import scipy.sparse as sp
+from copy import copy, deepcopy
 import seaborn as sns
 import re
+import os
+import json
+import importlib
+import hashlib
+from itertools import count
+from pydata.options import get_option
+
+_versions = count(1)
 
 
 class ldata:
@@ -38,35 +47,56 @@ class ldata:
     >>> x.annotation
     """
 
-    def __init__(self, data, description, annotation):
+    def __init__(self, data, description, annotation, validation=None):
         """
         Parameters
         ----------
         data : pandas.DataFrame
             A DataFrame of data with columns representing samples and rows
-            representing features.
+            representing features. DataFrames of pandas sparse columns are
+            stored as a scipy.sparse matrix.
         description: pandas.DataFrame
             A DataFrame of sample descriptions with ID column matching
             columns names of data attribute.
         annotation: pandas.DataFrame
             A DataFrame of feature annotation with ID column matching
             row names of data attribute.
+        validation: str
+            Level of validation. Either "full", "fast" or "off". Default is
+            the pydata "validation" option.
         """
 
-        self._data = deepcopy(data)
-        self._description = deepcopy(description)
-        self._annotation = deepcopy(annotation)
-        self._validate()
+        if self._is_sparse_frame(data):
+            self._data = None
+            self._view = _lview.from_sparse_frame(data)
+        else:
+            self._data = self._copy_frame(data)
+            self._view = None
+        self._description = self._copy_frame(description)
+        self._annotation = self._copy_frame(annotation)
+        self._new_version()
+        self._validate(validation)
 
     def __str__(self):
         t = self._format_type()
-        return f"{t} object:\n - Dimensions: {self.data.shape[1]} (samples) x {self.data.shape[0]} (features)"
+        shape = self._shape()
+        return (
+            f"{t} object:\n - Dimensions: {shape[1]} (samples) x {shape[0]} (features)"
+        )
 
     def __repr__(self):
         t = self._format_type()
-        return f"{t} object:\n - Dimensions: {self.data.shape[1]} (samples) x {self.data.shape[0]} (features)"
+        shape = self._shape()
+        return (
+            f"{t} object:\n - Dimensions: {shape[1]} (samples) x {shape[0]} (features)"
+        )
 
     def _get_data(self):
+        if self._data is None:
+            if self._view.is_sparse():
+                return self._view.to_frame()
+            self._data = self._view.to_frame()
+            self._view = None
         return self._data
 
     def _set_data(self, value: pd.DataFrame):
@@ -76,14 +106,71 @@ class ldata:
         ----------
         value: pandas.core.frame.DataFrame
             A DataFrame of data with columns representing samples and rows
-            representing features.
+            representing features. DataFrames of pandas sparse columns are
+            stored as a scipy.sparse matrix.
         """
         assert isinstance(value, pd.DataFrame), "data is not DataFrame"
         self._check_dimnames(data=value)
+        self._new_version()
+        if self._is_sparse_frame(value):
+            self._data = None
+            self._view = _lview.from_sparse_frame(value)
+            return
+        if get_option("copy_on_write"):
+            value = value.copy(deep=False)
         self._data = value
+        self._view = None
 
     data = property(_get_data, _set_data)
 
+    def _get_is_sparse(self):
+        return self._data is None and self._view.is_sparse()
+
+    is_sparse = property(_get_is_sparse)
+
+    def to_sparse(self, format: str = "csr"):
+        """Convert ldata object to sparse data storage
+
+        Parameters
+        ----------
+        format: str
+            scipy.sparse format of data. Either "csr" or "csc". Default is
+            "csr".
+
+        Returns
+        ----------
+        ldata object.
+
+        Examples
+        ----------
+        >>> x = ldata.example_ldata()
+        >>> x.to_sparse()
+        """
+        match format:
+            case "csr":
+                dat = sp.csr_matrix(self._matrix())
+            case "csc":
+                dat = sp.csc_matrix(self._matrix())
+            case _:
+                raise Exception(format + " sparse format not implemented")
+        return self._copy_matrix(dat)
+
+    def to_dense(self):
+        """Convert ldata object to dense data storage
+
+        Returns
+        ----------
+        ldata object.
+
+        Examples
+        ----------
+        >>> x = ldata.example_ldata().to_sparse()
+        >>> x.to_dense()
+        """
+        if not self.is_sparse:
+            return self._copy()
+        return self._copy_matrix(self._matrix().toarray())
+
     def _get_description(self):
         return self._description
 
@@ -98,6 +185,7 @@ class ldata:
         """
         self._check_dimnames(description=value)
         self._description = value
+        self._new_version()
 
     description = property(_get_description, _set_description)
 
@@ -119,7 +207,7 @@ class ldata:
     annotation = property(_get_annotation, _set_annotation)
 
     def _get_rownames(self):
-        return self.data.index.values.tolist()
+        return self._index().values.tolist()
 
     def _set_rownames(self, value: list):
         """Set feature names for ldata object.
@@ -130,15 +218,23 @@ class ldata:
             A list of feature names.
         """
         assert isinstance(value, list), "value must be list"
-        assert len(value) == self.data.shape[0], "value does not match data dims"
+        assert len(value) == self._shape()[0], "value does not match data dims"
         assert len(value) == len(set(value)), "value must contain unique IDs"
-        self.annotation["ID"] = value
-        self.data.index = value
+        annot = self.annotation.copy(deep=False)
+        annot["ID"] = value
+        if self._data is None:
+            self._view = self._view.relabel(index=pd.Index(value))
+        else:
+            dat = self._data.copy(deep=False)
+            dat.index = value
+            self._data = dat
+        self._annotation = annot
+        self._new_version()
 
     rownames = property(_get_rownames, _set_rownames)
 
     def _get_colnames(self):
-        return self.data.columns.tolist()
+        return self._columns().tolist()
 
     def _set_colnames(self, value: list):
         """Set sample names for ldata object.
@@ -149,10 +245,18 @@ class ldata:
             A list of sample names.
         """
         assert isinstance(value, list), "value must be list"
-        assert len(value) == self.data.shape[1], "value does not match data dims"
+        assert len(value) == self._shape()[1], "value does not match data dims"
         assert len(value) == len(set(value)), "value must contain unique IDs"
-        self.description["ID"] = value
-        self.data.columns = value
+        desc = self.description.copy(deep=False)
+        desc["ID"] = value
+        if self._data is None:
+            self._view = self._view.relabel(columns=pd.Index(value))
+        else:
+            dat = self._data.copy(deep=False)
+            dat.columns = value
+            self._data = dat
+        self._description = desc
+        self._new_version()
 
     colnames = property(_get_colnames, _set_colnames)
 
@@ -174,16 +278,52 @@ class ldata:
 
     dimnames = property(_get_dimnames, _set_dimnames)
 
-    def _validate(self):
-        assert isinstance(self.data, pd.DataFrame), "data is not DataFrame"
-        assert all(
-            self.data.dtypes.map(pd.api.types.is_numeric_dtype)
-        ), "data must all be numeric values"
+    def _validate(self, level: str = None):
+        """Validate ldata object.
+
+        Parameters
+        ----------
+        level: str
+            Level of validation. Either "full" for all checks, "fast" for
+            shape and data type checks only or "off" for no checks. Default is
+            the pydata "validation" option.
+        """
+        level = self._validation_level(level)
+        if level == "off":
+            return
+        if self._data is not None:
+            assert isinstance(self._data, pd.DataFrame), "data is not DataFrame"
+        assert self._is_numeric(), "data must all be numeric values"
         assert isinstance(
             self.description, pd.DataFrame
         ), "description is not DataFrame"
         assert isinstance(self.annotation, pd.DataFrame), "annotation is not DataFrame"
-        self._check_dimnames()
+        if level == "fast":
+            shape = self._shape()
+            assert (
+                shape[0] == self.annotation.shape[0]
+            ), "data rownames do not match annotation ID"
+            assert (
+                shape[1] == self.description.shape[0]
+            ), "data colnames do not match description ID"
+        else:
+            self._check_dimnames()
+
+    @staticmethod
+    def _validation_level(level: str = None):
+        if level is None:
+            level = get_option("validation")
+        assert level in [
+            "full",
+            "fast",
+            "off",
+        ], "validation must be 'full', 'fast' or 'off'"
+        return level
+
+    def _is_numeric(self):
+        if self._data is None:
+            return self._view.is_numeric()
+        return all(self._data.dtypes.map(pd.api.types.is_numeric_dtype))
 
     def _check_dimnames(
         self,
@@ -191,22 +331,32 @@ class ldata:
         description: pd.DataFrame = None,
         annotation: pd.DataFrame = None,
     ):
-        if data is None:
-            data = self.data
         if description is None:
             description = self.description
         if annotation is None:
             annotation = self.annotation
-        rownames = data.index.values.tolist()
-        colnames = data.columns.tolist()
-        assert len(rownames) == len(set(rownames)), "rownames must contain unique IDs"
-        assert len(colnames) == len(set(colnames)), "colnames must contain unique IDs"
-        assert (
-            rownames == annotation["ID"].tolist()
+        if data is None:
+            rownames = self._index()
+            colnames = self._columns()
+        else:
+            rownames = data.index
+            colnames = data.columns
+
+        # Skip checks if dimnames and metadata are unchanged since last check
+        key = (rownames, colnames, description, annotation)
+        checked = getattr(self, "_checked_dimnames", None)
+        if checked is not None and all(i is j for i, j in zip(key, checked)):
+            return
+
+        assert rownames.is_unique, "rownames must contain unique IDs"
+        assert colnames.is_unique, "colnames must contain unique IDs"
+        assert rownames.equals(
+            pd.Index(annotation["ID"])
         ), "data rownames do not match annotation ID"
-        assert (
-            colnames == description["ID"].tolist()
+        assert colnames.equals(
+            pd.Index(description["ID"])
         ), "data colnames do not match description ID"
+        self._checked_dimnames = key
 
     @staticmethod
     def example_ldata(type: str = "iris", **kwargs):
@@ -296,6 +446,10 @@ class ldata:
     def subset(self, samples=None, features=None):
         """Subset ldata object
 
+        The subset is a lazy view of the data of the original object which is
+        only realised when its data is accessed. Subsets of subsets are
+        composed without accessing the data.
+
         Parameters
         ----------
         samples:
@@ -313,26 +467,23 @@ class ldata:
         >>> x.subset(samples = ["Sample1"])
         """
         if samples is None:
-            samples = self.colnames
+            samples = self._columns()
         if features is None:
-            features = self.rownames
+            features = self._index()
 
-        assert set(samples).issubset(self.colnames), "samples are not in data"
-        assert set(features).issubset(self.rownames), "features are not in data"
+        cols = self._columns().get_indexer(samples)
+        assert (cols != -1).all(), "samples are not in data"
+        assert pd.Index(features).isin(self._index()).all(), "features are not in data"
 
-        self = deepcopy(self)
-        new_dat = deepcopy(self.data)
-        new_dat = new_dat[samples][new_dat.index.isin(features)]
-        new_desc = deepcopy(self.description)
-        new_desc = new_desc[new_desc["ID"].isin(samples)].reset_index(drop=True)
-        new_annot = deepcopy(self.annotation)
-        new_annot = new_annot[new_annot["ID"].isin(features)].reset_index(drop=True)
+        rows = np.flatnonzero(self._index().isin(features))
 
-        self._data = new_dat
-        self._description = new_desc
-        self._annotation = new_annot
-        self._validate()
-        return self
+        out = self._copy(
+            view=self._as_view().take(rows=rows, cols=cols),
+            description=self.description.iloc[cols].reset_index(drop=True),
+            annotation=self.annotation.iloc[rows].reset_index(drop=True),
+        )
+        out._validate()
+        return out
 
     def transpose(self):
         """Transpose ldata object
@@ -350,15 +501,20 @@ class ldata:
         >>> x = ldata.example_ldata()
         >>> x.transpose()
         """
-        self = deepcopy(self)
-        new_dat = deepcopy(self.data)
-        new_desc = deepcopy(self.description)
-        new_annot = deepcopy(self.annotation)
-        self._data = new_dat.transpose()
-        self._description = new_annot
-        self._annotation = new_desc
-        self._validate()
-        return self
+        if self._data is None:
+            out = self._copy(
+                view=self._view.transpose(),
+                description=self._copy_frame(self.annotation),
+                annotation=self._copy_frame(self.description),
+            )
+        else:
+            out = self._copy(
+                data=self._copy_frame(self._data.transpose()),
+                description=self._copy_frame(self.annotation),
+                annotation=self._copy_frame(self.description),
+            )
+        out._validate()
+        return out
 
     def concat(self, *objs):
         """Concatenate samples from multiple ldata objects
@@ -391,13 +547,533 @@ class ldata:
         assert all(
             [i.rownames == self.rownames for i in objs]
         ), "objects must have same feature IDs"
-        self = deepcopy(self)
-        self._data = pd.concat([self.data] + [i.data for i in objs], axis=1)
-        self._description = pd.concat(
-            [self.description] + [i.description for i in objs]
-        ).reset_index(drop=True)
-        self._validate()
-        return self
+        desc = pd.concat([self.description] + [i.description for i in objs])
+        if any([i.is_sparse for i in (self,) + objs]):
+            dat = sp.hstack([i._matrix() for i in (self,) + objs], format="csr")
+            columns = self._columns().append([i._columns() for i in objs])
+            out = self._copy(
+                view=_lview(dat, self._index(), columns),
+                description=desc.reset_index(drop=True),
+            )
+        else:
+            out = self._copy(
+                data=pd.concat([self.data] + [i.data for i in objs], axis=1),
+                description=desc.reset_index(drop=True),
+            )
+        out._validate()
+        return out
+
+    def save(self, path: str, overwrite: bool = False):
+        """Save ldata object
+
+        Saves the ldata object to a directory. The data is stored as a numpy
+        .npy file, or scipy.sparse .npz file for sparse data, columns of description and annotation as individual .npy
+        files and object metadata, including attached results such as pydata
+        dimension reductions, as json.
+
+        Parameters
+        ----------
+        path: str
+            Path of directory to save ldata object to.
+        overwrite: bool
+            Whether to overwrite an existing directory. Default is False.
+
+        Examples
+        ----------
+        >>> x = ldata.example_ldata()
+        >>> x.save("iris")
+        >>> ldata.load("iris")
+        """
+        assert overwrite or not os.path.exists(path), path + " already exists"
+        os.makedirs(path, exist_ok=True)
+        if self.is_sparse:
+            sp.save_npz(os.path.join(path, "data.npz"), self._matrix())
+        else:
+            np.save(os.path.join(path, "data.npy"), self._matrix(), allow_pickle=False)
+        meta = {
+            "type": [type(self).__module__, type(self).__name__],
+            "sparse": self.is_sparse,
+            "metadata": self._metadata(),
+            "description": self._save_frame(
+                self.description, os.path.join(path, "description")
+            ),
+            "annotation": self._save_frame(
+                self.annotation, os.path.join(path, "annotation")
+            ),
+            "results": [],
+        }
+        for name, result in self._results().items():
+            if result is not None:
+                result.save(os.path.join(path, name), overwrite=overwrite)
+                meta["results"] += [name]
+        with open(os.path.join(path, "metadata.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+
+    @staticmethod
+    def load(path: str, mmap: bool = True, validation: str = None):
+        """Load ldata object
+
+        Load ldata object, or subclass object, saved with ldata.save. By
+        default the data is memory mapped so loading is near instant and only
+        the parts of the data which are used are read from disk. Changes to
+        memory mapped data are not written to disk. Sparse data is read into
+        memory.
+
+        Parameters
+        ----------
+        path: str
+            Path of directory containing saved ldata object.
+        mmap: bool
+            Whether to memory map the data. Default is True.
+        validation: str
+            Level of validation. Either "full", "fast" or "off". Default is
+            the pydata "validation" option.
+
+        Returns
+        ----------
+        ldata object.
+
+        Examples
+        ----------
+        >>> x = ldata.example_ldata()
+        >>> x.save("iris")
+        >>> ldata.load("iris")
+        """
+        with open(os.path.join(path, "metadata.json")) as f:
+            meta = json.load(f)
+        module, name = meta["type"]
+        cls = getattr(importlib.import_module(module), name)
+        if meta.get("sparse", False):
+            dat = sp.load_npz(os.path.join(path, "data.npz"))
+        else:
+            dat = np.load(
+                os.path.join(path, "data.npy"), mmap_mode="c" if mmap else None
+            )
+        desc = ldata._load_frame(os.path.join(path, "description"), meta["description"])
+        annot = ldata._load_frame(os.path.join(path, "annotation"), meta["annotation"])
+
+        out = cls._from_view(
+            _lview(dat, pd.Index(annot["ID"]), pd.Index(desc["ID"])),
+            desc,
+            annot,
+            validation,
+            **meta["metadata"],
+        )
+        for name in meta["results"]:
+            setattr(out, name, ldata.load(os.path.join(path, name), mmap, validation))
+        return out
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: str,
+        description: pd.DataFrame = None,
+        annotation: pd.DataFrame = None,
+        filter_method: str = None,
+        thresh: float = 10,
+        chunksize: int = 10000,
+        sep: str = ",",
+        validation: str = None,
+        **kwargs,
+    ):
+        """Read ldata object from delimited file
+
+        Reads a delimited file of features (rows) by samples (columns), with
+        feature IDs in the first column, in chunks of rows. Integer data is
+        stored in the smallest integer data type which fits and features can
+        be filtered whilst reading so they are never held in memory.
+
+        Parameters
+        ----------
+        path: str
+            Path to delimited file.
+        description: pandas.DataFrame
+            A DataFrame of sample descriptions with ID column matching
+            columns of file. Default is a DataFrame of sample IDs.
+        annotation: pandas.DataFrame
+            A DataFrame of feature annotation with ID column containing
+            features of file. Default is a DataFrame of feature IDs.
+        filter_method: str
+            Method of filtering features. Either "sum", "mean" or "min" of
+            feature values must be greater or equal to thresh. Default is None
+            for no filtering.
+        thresh: float
+            Threshold of feature filtering. Default is 10.
+        chunksize: int
+            Number of rows to read per chunk. Default is 10000.
+        sep: str
+            Delimiter of file. Default is ",".
+        validation: str
+            Level of validation. Either "full", "fast" or "off". Default is
+            the pydata "validation" option.
+        **kwargs:
+            Metadata attributes of ldata subclass e.g. gtf for rnadata.
+
+        Returns
+        ----------
+        ldata object.
+
+        Examples
+        ----------
+        >>> x = ldata.example_ldata(type="simulate")
+        >>> x.data.to_csv("simulate.csv")
+        >>> ldata.from_csv("simulate.csv", filter_method="mean", thresh=5)
+        """
+        blocks = []
+        index = []
+        columns = None
+        for chunk in pd.read_csv(path, sep=sep, index_col=0, chunksize=chunksize):
+            columns = chunk.columns
+            if filter_method is not None:
+                chunk = chunk[ldata._filter_keep(chunk, filter_method, thresh)]
+            if chunk.shape[0] == 0:
+                continue
+            blocks += [ldata._downcast(chunk.to_numpy())]
+            index += [chunk.index]
+        dat = np.concatenate(blocks) if blocks else np.empty((0, len(columns)))
+        index = index[0].append(index[1:]) if index else pd.Index([])
+
+        if description is None:
+            description = pd.DataFrame({"ID": columns})
+        if annotation is None:
+            annotation = pd.DataFrame({"ID": index})
+        else:
+            annotation = annotation[annotation["ID"].isin(index)]
+            annotation = annotation.reset_index(drop=True)
+        return cls._from_view(
+            _lview(dat, index, columns), description, annotation, validation, **kwargs
+        )
+
+    @classmethod
+    def from_tsv(cls, path: str, **kwargs):
+        """Read ldata object from tab delimited file
+
+        See ldata.from_csv for details.
+
+        Parameters
+        ----------
+        path: str
+            Path to tab delimited file.
+        **kwargs:
+            Passed to from_csv.
+
+        Returns
+        ----------
+        ldata object.
+        """
+        return cls.from_csv(path, sep="\t", **kwargs)
+
+    @classmethod
+    def _from_view(cls, view, description, annotation, validation=None, **metadata):
+        out = cls.__new__(cls)
+        out._data = None
+        out._view = view
+        out._description = description
+        out._annotation = annotation
+        for key, value in metadata.items():
+            setattr(out, "_" + key, value)
+        out._new_version()
+        out._validate(validation)
+        return out
+
+    @staticmethod
+    def _filter_keep(x, method: str, thresh: float):
+        match method:
+            case "sum":
+                stat = x.sum(axis=1)
+            case "mean":
+                stat = x.mean(axis=1)
+            case "min":
+                stat = x.min(axis=1)
+            case _:
+                raise Exception(method + " filtering not implemented")
+        if sp.issparse(stat):
+            stat = stat.toarray()
+        return np.asarray(stat).ravel() >= thresh
+
+    @staticmethod
+    def _downcast(x: np.ndarray):
+        if x.dtype.kind not in "iu" or x.size == 0:
+            return x
+        dtype = np.result_type(np.min_scalar_type(x.min()), np.min_scalar_type(x.max()))
+        return x.astype(dtype)
+
+    def _metadata(self):
+        """Metadata attributes saved and loaded with ldata objects."""
+        return {}
+
+    def _results(self):
+        """Result objects saved and loaded with ldata objects."""
+        return {}
+
+    @staticmethod
+    def _save_frame(x: pd.DataFrame, path: str):
+        os.makedirs(path, exist_ok=True)
+        columns = []
+        for i, (name, col) in enumerate(x.items()):
+            values = col.to_numpy()
+            na = bool(col.isna().any())
+            if values.dtype == object:
+                values = col.astype(object).where(col.notna(), "").to_numpy(str)
+                if na:
+                    np.save(os.path.join(path, f"{i}_na.npy"), col.isna().to_numpy())
+            np.save(os.path.join(path, f"{i}.npy"), values, allow_pickle=False)
+            columns += [{"name": name, "dtype": str(col.dtype), "na": na}]
+        return columns
+
+    @staticmethod
+    def _load_frame(path: str, columns: list):
+        out = {}
+        for i, col in enumerate(columns):
+            values = np.load(os.path.join(path, f"{i}.npy"))
+            if values.dtype.kind == "U":
+                values = values.astype(object)
+                if col["na"]:
+                    values[np.load(os.path.join(path, f"{i}_na.npy"))] = None
+            out[col["name"]] = pd.Series(values).astype(col["dtype"])
+        return pd.DataFrame(out)
+
+    def _copy(self, data=None, description=None, annotation=None, view=None):
+        """Copy ldata object.
+
+        DataFrames or data views which are given replace those of the copied
+        object. All other DataFrames are copied, or shared if copy_on_write
+        option is set.
+        """
+        out = copy(self)
+        if view is not None:
+            out._data = None
+            out._view = view
+        elif data is not None:
+            out._data = data
+            out._view = None
+        elif self._data is not None:
+            out._data = self._copy_frame(self._data)
+        out._description = (
+            self._copy_frame(self.description) if description is None else description
+        )
+        out._annotation = (
+            self._copy_frame(self.annotation) if annotation is None else annotation
+        )
+        out._new_version()
+        return out
+
+    def _new_version(self):
+        """Stamp ldata object with a new data version.
+
+        Called on creation, copying and mutation of data, description or
+        dimnames so that results cached by data version are not reused for
+        changed data.
+        """
+        self._version = next(_versions)
+
+    def _content_hash(self):
+        """Hash of data, dimnames and description, cached by data version."""
+        cached = getattr(self, "_hash", (None, None))
+        if cached[0] == self._version:
+            return cached[1]
+        h = hashlib.sha1()
+        dat = self._matrix()
+        if sp.issparse(dat):
+            dat = dat.tocsr()
+            for i in [dat.data, dat.indices, dat.indptr]:
+                h.update(np.ascontiguousarray(i).tobytes())
+        else:
+            h.update(str(dat.dtype).encode())
+            h.update(np.ascontiguousarray(dat).tobytes())
+        for i in [self._index(), self._columns()]:
+            h.update(pd.util.hash_pandas_object(i).to_numpy().tobytes())
+        h.update(pd.util.hash_pandas_object(self.description).to_numpy().tobytes())
+        h.update(str(self.description.columns.tolist()).encode())
+        self._hash = (self._version, h.hexdigest())
+        return self._hash[1]
+
+    def _shape(self):
+        if self._data is None:
+            return self._view.shape
+        return self._data.shape
+
+    def _index(self):
+        if self._data is None:
+            return self._view.index
+        return self._data.index
+
+    def _columns(self):
+        if self._data is None:
+            return self._view.columns
+        return self._data.columns
+
+    def _matrix(self):
+        """Data as a numpy array or scipy.sparse matrix of features by samples."""
+        if self._data is None:
+            return self._view.values()
+        return self._data.to_numpy()
+
+    def _sample_batches(self, batch_size: int, min_size: int = 1):
+        """Yield data as dense samples by features arrays of batch_size samples.
+
+        A final batch smaller than min_size is merged into the previous batch.
+        """
+        view = self._as_view()
+        n = self._shape()[1]
+        starts = list(range(0, n, batch_size))
+        if len(starts) > 1 and n - starts[-1] < min_size:
+            starts.pop()
+        for start, stop in zip(starts, starts[1:] + [n]):
+            x = view.take(cols=np.arange(start, stop)).values()
+            yield x.toarray().T if sp.issparse(x) else np.asarray(x).T
+
+    @staticmethod
+    def _is_sparse_frame(x):
+        return (
+            isinstance(x, pd.DataFrame)
+            and x.shape[1] > 0
+            and all([isinstance(i, pd.SparseDtype) for i in x.dtypes])
+        )
+
+    def _as_view(self):
+        if self._data is None:
+            return self._view
+        return _lview(self._data.copy(deep=False), self._data.index, self._data.columns)
+
+    def _copy_matrix(self, x):
+        """Copy ldata object with data replaced by array or sparse matrix."""
+        if sp.issparse(x):
+            return self._copy(view=_lview(x, self._index(), self._columns()))
+        return self._copy(
+            data=pd.DataFrame(x, index=self._index(), columns=self._columns())
+        )
+
+    @staticmethod
+    def _copy_frame(x: pd.DataFrame):
+        if get_option("copy_on_write") and isinstance(x, pd.DataFrame):
+            return x.copy(deep=False)
+        return deepcopy(x)
 
     def _format_type(self):
         return re.findall("'([^']*)'", str(type(self)))[0].split(".")[-1]
+
+
+class _lview:
+    """Lazy view of a two dimensional data block.
+
+    Stores integer row and column indexers over a DataFrame or array block
+    and only builds a DataFrame when requested.
+    """
+
+    def __init__(self, block, index, columns, rows=None, cols=None):
+        """
+        Parameters
+        ----------
+        block:
+            pandas.DataFrame or numpy.ndarray of data.
+        index: pandas.Index
+            Row names of the view.
+        columns: pandas.Index
+            Column names of the view.
+        rows: numpy.ndarray
+            Integer positions of block rows in the view. None for all rows.
+        cols: numpy.ndarray
+            Integer positions of block columns in the view. None for all
+            columns.
+        """
+        self.block = block
+        self.index = index
+        self.columns = columns
+        self.rows = rows
+        self.cols = cols
+
+    @staticmethod
+    def from_sparse_frame(x: pd.DataFrame):
+        return _lview(sp.csr_matrix(x.sparse.to_coo()), x.index, x.columns)
+
+    @property
+    def shape(self):
+        return (len(self.index), len(self.columns))
+
+    def is_sparse(self):
+        return sp.issparse(self.block)
+
+    def take(self, rows=None, cols=None):
+        """Compose view with integer row and column positions of the view."""
+        return _lview(
+            self.block,
+            self.index if rows is None else self.index.take(rows),
+            self.columns if cols is None else self.columns.take(cols),
+            self._compose(self.rows, rows),
+            self._compose(self.cols, cols),
+        )
+
+    def is_numeric(self):
+        if isinstance(self.block, pd.DataFrame):
+            return all(self.block.dtypes.map(pd.api.types.is_numeric_dtype))
+        return pd.api.types.is_numeric_dtype(self.block.dtype)
+
+    def transpose(self):
+        return _lview(self.block.T, self.columns, self.index, self.cols, self.rows)
+
+    def relabel(self, index=None, columns=None):
+        return _lview(
+            self.block,
+            self.index if index is None else index,
+            self.columns if columns is None else columns,
+            self.rows,
+            self.cols,
+        )
+
+    def values(self):
+        block = self.block
+        if isinstance(block, pd.DataFrame):
+            if not self._is_homogeneous(block):
+                return self._take_frame(block).to_numpy()
+            block = block.to_numpy(copy=self.rows is None and self.cols is None)
+        if sp.issparse(block):
+            if self.rows is not None:
+                block = block[self.rows, :]
+            if self.cols is not None:
+                block = block[:, self.cols]
+            return block
+        if self.rows is not None and self.cols is not None:
+            return block[np.ix_(self.rows, self.cols)]
+        if self.rows is not None:
+            return block[self.rows]
+        if self.cols is not None:
+            return block[:, self.cols]
+        return block
+
+    def to_frame(self):
+        block = self.block
+        if isinstance(block, pd.DataFrame) and not self._is_homogeneous(block):
+            out = self._take_frame(block)
+            out.index = self.index
+            out.columns = self.columns
+            return out
+        if sp.issparse(block):
+            return pd.DataFrame.sparse.from_spmatrix(
+                self.values(), index=self.index, columns=self.columns
+            )
+        return pd.DataFrame(
+            self.values(), index=self.index, columns=self.columns, copy=False
+        )
+
+    def _take_frame(self, x: pd.DataFrame):
+        if self.rows is None and self.cols is None:
+            return x.copy()
+        if self.rows is not None:
+            x = x.take(self.rows, axis=0)
+        if self.cols is not None:
+            x = x.take(self.cols, axis=1)
+        return x
+
+    @staticmethod
+    def _is_homogeneous(x: pd.DataFrame):
+        dtypes = set(x.dtypes)
+        return len(dtypes) == 1 and isinstance(dtypes.pop(), np.dtype)
+
+    @staticmethod
+    def _compose(x, y):
+        if y is None:
+            return x
+        if x is None:
+            return np.asarray(y, dtype=np.intp)
+        return x[y]
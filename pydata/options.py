@@ -0,0 +1,121 @@
+import pandas as pd
+from contextlib import contextmanager
+
+_defaults = {
+    "copy_on_write": False,
+    "validation": "full",
+    "result_cache_memory": 256 * 2**20,
+    "result_cache_dir": None,
+}
+
+_options = dict(_defaults)
+
+
+def get_option(key: str):
+    """Get value of a pydata option.
+
+    Parameters
+    ----------
+    key: str
+        Name of option.
+
+    Returns
+    ----------
+    Value of option.
+
+    Examples
+    ----------
+    >>> get_option("copy_on_write")
+    """
+    assert key in _options, key + " is not a pydata option"
+    return _options[key]
+
+
+def set_option(key: str, value):
+    """Set value of a pydata option.
+
+    Options
+    ----------
+    copy_on_write: bool
+        Whether ldata objects and operations share the underlying DataFrames
+        and only copy them when they are modified. Enables pandas copy on
+        write mode. Default is False.
+    validation: str
+        Level of validation of ldata objects. Either "full" for all checks,
+        "fast" for shape and data type checks only or "off" for no checks.
+        Default is "full".
+    result_cache_memory: int
+        Memory limit in bytes of cached dimension reduction results of
+        pydata.perform_dimension_reduction. 0 disables the in memory cache.
+        Default is 256 MiB.
+    result_cache_dir: str
+        Directory where cached dimension reduction results are also written
+        and read from, so they can be reused across sessions. Default is None
+        for no disk cache.
+
+    Parameters
+    ----------
+    key: str
+        Name of option.
+    value:
+        Value of option.
+
+    Examples
+    ----------
+    >>> set_option("copy_on_write", True)
+    """
+    assert key in _options, key + " is not a pydata option"
+    match key:
+        case "copy_on_write":
+            assert isinstance(value, bool), "copy_on_write must be bool"
+            pd.set_option("mode.copy_on_write", value)
+        case "validation":
+            assert value in [
+                "full",
+                "fast",
+                "off",
+            ], "validation must be 'full', 'fast' or 'off'"
+        case "result_cache_memory":
+            assert (
+                isinstance(value, int) and value >= 0
+            ), "result_cache_memory must be non-negative int"
+        case "result_cache_dir":
+            assert value is None or isinstance(
+                value, str
+            ), "result_cache_dir must be None or str"
+    _options[key] = value
+
+
+def reset_option(key: str):
+    """Reset pydata option to default value.
+
+    Parameters
+    ----------
+    key: str
+        Name of option.
+    """
+    set_option(key, _defaults[key])
+
+
+@contextmanager
+def option_context(key: str, value):
+    """Temporarily set value of a pydata option.
+
+    Parameters
+    ----------
+    key: str
+        Name of option.
+    value:
+        Value of option within context.
+
+    Examples
+    ----------
+    >>> with option_context("copy_on_write", True):
+    >>>     x = ldata.example_ldata()
+    """
+    old = get_option(key)
+    set_option(key, value)
+    try:
+        yield
+    finally:
+        set_option(key, old)
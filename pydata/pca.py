@@ -3,7 +3,9 @@ from pydata.drdata import drdata
 import pandas as pd
 import numpy as np
 import re
-from sklearn.decomposition import PCA, KernelPCA
+from sklearn.decomposition import PCA, KernelPCA, TruncatedSVD, IncrementalPCA
+import scipy.sparse as sp
+from sklearn.preprocessing import FunctionTransformer
 import seaborn as sns
 import plotly.express as px
 import matplotlib.pyplot as plt
@@ -14,7 +16,15 @@ class pca(drdata):
     Perform and store results from principal component analysis (PCA)
     """
 
-    def __init__(self, data, description, annotation, scaling=None, method=None):
+    def __init__(
+        self,
+        data,
+        description,
+        annotation,
+        scaling=None,
+        method=None,
+        validation=None,
+    ):
         """
         Parameters
         ----------
@@ -31,11 +41,14 @@ class pca(drdata):
             String describing the scaling procedure used before PCA e.g. zscore
         method: str
             String describing the method used to perform PCA e.g. SVD
+        validation: str
+            Level of validation. Either "full", "fast" or "off". Default is
+            the pydata "validation" option.
         """
 
-        super().__init__(data, description, annotation, scaling)
+        super().__init__(data, description, annotation, scaling, validation)
         self._method = method
-        self._validate()
+        self._validate(validation)
 
     def __str__(self):
         out = super().__str__()
@@ -53,6 +66,9 @@ class pca(drdata):
 
     method = property(_get_method, _set_method)
 
+    def _metadata(self):
+        return {**super()._metadata(), "method": self.method}
+
     def _get_annotation(self):
         return super(pca, self)._get_annotation()
 
@@ -75,11 +91,13 @@ class pca(drdata):
 
     annotation = property(_get_annotation, _set_annotation)
 
-    def _validate(self):
-        assert (
-            "Percentage variance explained" in self.annotation.columns
-        ), "annotation must contain 'Percentage variance explained' column"
-        super()._validate()
+    def _validate(self, level: str = None):
+        level = self._validation_level(level)
+        if level != "off":
+            assert (
+                "Percentage variance explained" in self.annotation.columns
+            ), "annotation must contain 'Percentage variance explained' column"
+        super()._validate(level)
 
     def plot(self, type: str = "scatter", **kwargs):
         """Plot pca object.
@@ -139,10 +157,25 @@ class pca(drdata):
         scaling: str
             Scaling method before PCA calculation. Default is "zscore".
         method: str
-            PCA method for PCA calculation: Default is "SVD" for singular
-            value decomposition.
+            PCA method for PCA calculation. Either "SVD" for singular value
+            decomposition, "Randomized" for randomized truncated SVD, "ARPACK"
+            for ARPACK truncated SVD, "Covariance" for eigendecomposition of
+            the feature covariance matrix, "Kernel" for kernel PCA or "auto".
+            "auto" uses "Covariance" for tall and skinny data (at most 1000
+            features and at least 10 times as many samples as features),
+            "Randomized" for sparse data or data with more than 500 samples
+            or features where n_comp is less than 80% of the smallest
+            dimension and "SVD" otherwise. "Incremental" fits scaling and
+            incremental PCA one batch of samples at a time, bounding memory
+            use by batch_size for large or memory mapped data. The chosen
+            method is recorded in the method attribute. Default is "SVD".
         **kwargs:
-            Passed to PCA method.
+            Passed to PCA method. "Incremental" also accepts batch_size, the
+            number of samples per batch, with default of 5 times the number
+            of features.
+
+        SVD based methods do not center sparse data, which would make the data
+        dense, and use sklearn.decomposition.TruncatedSVD instead.
 
         Returns
         ----------
@@ -153,12 +186,42 @@ class pca(drdata):
         >>> x = pydata.example_pydata()
         >>> pca.analyse(x)
         """
-        dat = drdata.scale(data=data, method=scaling)
+        if method == "Incremental":
+            pcs = pca._incremental_pca(
+                data=data, n_comp=n_comp, scaling=scaling, **kwargs
+            )
+            pcs.scaling = scaling
+            pcs.method = method
+            return pcs
+
+        dat, scaler = drdata._scale(data=data, method=scaling)
+        if method == "auto":
+            method = pca._auto_method(dat, n_comp)
         match method:
             case "SVD":
                 pcs = pca._svd_pca(
                     x=dat, desc=data.description, n_comp=n_comp, **kwargs
                 )
+            case "Randomized":
+                pcs = pca._svd_pca(
+                    x=dat,
+                    desc=data.description,
+                    n_comp=n_comp,
+                    solver="randomized",
+                    **kwargs,
+                )
+            case "ARPACK":
+                pcs = pca._svd_pca(
+                    x=dat,
+                    desc=data.description,
+                    n_comp=n_comp,
+                    solver="arpack",
+                    **kwargs,
+                )
+            case "Covariance":
+                pcs = pca._covariance_pca(
+                    x=dat, desc=data.description, n_comp=n_comp, **kwargs
+                )
             case "Kernel":
                 pcs = pca._kernel_pca(
                     x=dat, desc=data.description, n_comp=n_comp, **kwargs
@@ -168,12 +231,82 @@ class pca(drdata):
 
         pcs.scaling = scaling
         pcs.method = method
-        return pcs
+        return pcs._fitted(scaler, pcs.model, data._index(), sp.issparse(dat))
+
+    @staticmethod
+    def _auto_method(x, n_comp):
+        n, p = x.shape
+        if p <= 1000 and n >= 10 * p:
+            return "Covariance"
+        if sp.issparse(x) or (max(n, p) > 500 and n_comp < 0.8 * min(n, p)):
+            return "Randomized"
+        return "SVD"
 
     @staticmethod
-    def _svd_pca(x, desc, n_comp, **kwargs):
-        p = PCA(n_components=n_comp, **kwargs)
+    def _svd_pca(x, desc, n_comp, solver: str = None, **kwargs):
+        if sp.issparse(x):
+            algorithm = "arpack" if solver == "arpack" else "randomized"
+            p = TruncatedSVD(n_components=n_comp, algorithm=algorithm, **kwargs)
+        else:
+            if solver is not None:
+                kwargs["svd_solver"] = solver
+            p = PCA(n_components=n_comp, **kwargs)
+        p_c = p.fit_transform(x)
+        out = pca._pca_object(p_c, p.explained_variance_ratio_, desc, n_comp)
+        out.model = p
+        return out
+
+    @staticmethod
+    def _covariance_pca(x, desc, n_comp):
+        n = x.shape[0]
+        mean = np.asarray(x.mean(axis=0)).ravel()
+        if sp.issparse(x):
+            cov = (x.T @ x).toarray() - n * np.outer(mean, mean)
+        else:
+            dat = np.asarray(x, dtype=float)
+            cov = dat.T @ dat - n * np.outer(mean, mean)
+        cov /= n - 1
+        eig_val, eig_vec = np.linalg.eigh(cov)
+        order = np.argsort(eig_val)[::-1][:n_comp]
+        eig_vec = eig_vec[:, order]
+        # Deterministic signs with largest absolute loading positive
+        signs = np.sign(eig_vec[np.abs(eig_vec).argmax(axis=0), range(n_comp)])
+        eig_vec *= np.where(signs == 0, 1, signs)
+        p = FunctionTransformer(
+            pca._project, kw_args={"mean": mean, "components": eig_vec}
+        )
         p_c = p.fit_transform(x)
+        var_ratio = eig_val[order] / eig_val.clip(min=0).sum()
+        out = pca._pca_object(p_c, var_ratio, desc, n_comp)
+        out.model = p
+        return out
+
+    @staticmethod
+    def _project(x, mean, components):
+        return np.asarray(x @ components) - mean @ components
+
+    @staticmethod
+    def _incremental_pca(data, n_comp, scaling, batch_size: int = None, **kwargs):
+        if batch_size is None:
+            batch_size = 5 * data._shape()[0]
+        batch_size = max(batch_size, n_comp)
+        scaler = drdata._batch_scaler(data, scaling, batch_size)
+        p = IncrementalPCA(n_components=n_comp, **kwargs)
+        for x in data._sample_batches(batch_size, min_size=n_comp):
+            p.partial_fit(x if scaler is None else scaler.transform(x))
+        p_c = np.vstack(
+            [
+                p.transform(x if scaler is None else scaler.transform(x))
+                for x in data._sample_batches(batch_size)
+            ]
+        )
+        out = pca._pca_object(
+            p_c, p.explained_variance_ratio_, data.description, n_comp
+        )
+        return out._fitted(scaler, p, data._index())
+
+    @staticmethod
+    def _pca_object(p_c, var_ratio, desc, n_comp):
         p_df = pd.DataFrame(
             data=p_c,
             columns=["PCA" + str(i) for i in range(1, n_comp + 1)],
@@ -182,7 +315,7 @@ class pca(drdata):
         var_expl = pd.DataFrame(
             {
                 "ID": p_df.columns.tolist(),
-                "Percentage variance explained": p.explained_variance_ratio_ * 100,
+                "Percentage variance explained": var_ratio * 100,
             }
         )
         out = pca(
@@ -214,4 +347,5 @@ class pca(drdata):
             description=desc,
             annotation=var_expl,
         )
+        out.model = p
         return out
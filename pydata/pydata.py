@@ -1,4 +1,6 @@
-from pydata.ldata import ldata
+from pydata.ldata import ldata, _lview
+from pydata.drdata import drdata
+from pydata import cache
 from pydata.pca import pca
 from pydata.lda import lda
 from pydata.tsne import tsne
@@ -10,6 +12,11 @@ from matplotlib.pyplot import gcf
 import seaborn as sns
 import plotly.express as px
 from copy import deepcopy
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+import scipy.sparse as sp
+import pickle
+import gc
 
 
 class pydata(ldata):
@@ -48,7 +55,7 @@ class pydata(ldata):
     >>> x.plot("distribution")
     """
 
-    def __init__(self, data, description, annotation):
+    def __init__(self, data, description, annotation, validation=None):
         """
         Parameters
         ----------
@@ -61,9 +68,12 @@ class pydata(ldata):
         annotation: pandas.DataFrame
             A DataFrame of feature annotation with ID column matching
             row names of data attribute.
+        validation: str
+            Level of validation. Either "full", "fast" or "off". Default is
+            the pydata "validation" option.
         """
 
-        super().__init__(data, description, annotation)
+        super().__init__(data, description, annotation, validation)
 
     @staticmethod
     def example_pydata(**kwargs):
@@ -89,7 +99,7 @@ class pydata(ldata):
         return pydata(out.data, out.description, out.annotation)
 
     def _get_pcs(self):
-        return getattr(self, "_pcs")
+        return getattr(self, "_pcs", None)
 
     def _set_pcs(self, value: pca):
         if value is not None:
@@ -100,7 +110,7 @@ class pydata(ldata):
     pcs = property(_get_pcs, _set_pcs)
 
     def _get_lda(self):
-        return getattr(self, "_lda")
+        return getattr(self, "_lda", None)
 
     def _set_lda(self, value: lda):
         if value is not None:
@@ -111,7 +121,7 @@ class pydata(ldata):
     lda = property(_get_lda, _set_lda)
 
     def _get_tsne(self):
-        return getattr(self, "_tsne")
+        return getattr(self, "_tsne", None)
 
     def _set_tsne(self, value: tsne):
         if value is not None:
@@ -122,7 +132,7 @@ class pydata(ldata):
     tsne = property(_get_tsne, _set_tsne)
 
     def _get_umap(self):
-        return getattr(self, "_umap")
+        return getattr(self, "_umap", None)
 
     def _set_umap(self, value: umap):
         if value is not None:
@@ -132,6 +142,29 @@ class pydata(ldata):
 
     umap = property(_get_umap, _set_umap)
 
+    def _results(self):
+        return {
+            "pcs": self.pcs,
+            "lda": self.lda,
+            "tsne": self.tsne,
+            "umap": self.umap,
+        }
+
+    def _scaled(self, method: str):
+        """Scaled data and fitted scaler cached by scaling method and data version.
+
+        See drdata.scale for details.
+        """
+        key = (method, self._version)
+        cache = getattr(self, "_scale_cache", {})
+        if key not in cache:
+            # Drop scaled data of previous versions. The cache is replaced
+            # rather than updated as copies of this object share it.
+            cache = {k: v for k, v in cache.items() if k[1] == self._version}
+            cache[key] = drdata._fit_scale(self, method)
+            self._scale_cache = cache
+        return cache[key]
+
     def subset(self, samples=None, features=None):
         out = super().subset(samples=samples, features=features)
         out.pcs = None
@@ -172,24 +205,212 @@ class pydata(ldata):
         **kwargs:
             Passed to dimension reduction methods.
 
+        Results are cached by type, kwargs and a hash of the data and
+        description, so repeated dimension reductions are reused. See the
+        "result_cache_memory" and "result_cache_dir" options.
+
         Examples
         ----------
         >>> x = pydata.example_pydata()
         >>> x.perform_dimension_reduction("pca")
         """
         self._validate()
+        cls, attr = self._reduction(type)
+        setattr(self, attr, self._reduce(cls, type, **kwargs))
+
+    def perform_dimension_reductions(self, specs: list, n_jobs: int = None):
+        """Perform multiple dimension reductions in parallel.
+
+        Runs dimension reductions concurrently in a pool of processes. Scaled
+        data are computed once per scaling method and shared with worker
+        processes through shared memory rather than being copied to each
+        worker. Cached results are reused as in perform_dimension_reduction.
+        Each result is attached to the object as it finishes, with the last
+        specification of each type attached once all have finished.
+
+        Parameters
+        ----------
+        specs: list
+            List of dicts with "type" key of dimension reduction type, either
+            "pca", "lda", "tsne" or "umap", and other keys passed to the
+            dimension reduction method.
+        n_jobs: int
+            Number of worker processes. Default is None for the number of
+            processors.
+
+        Returns
+        ----------
+        list of drdata objects in order of specs.
+
+        Examples
+        ----------
+        >>> x = pydata.example_pydata()
+        >>> x.perform_dimension_reductions(
+        >>>     [
+        >>>         {"type": "pca"},
+        >>>         {"type": "lda", "target": "Species"},
+        >>>         {"type": "tsne", "perplexity": 10},
+        >>>         {"type": "tsne", "perplexity": 30},
+        >>>         {"type": "umap"},
+        >>>     ]
+        >>> )
+        """
+        self._validate()
+        specs = [dict(i) for i in specs]
+        types = [i.pop("type") for i in specs]
+        keys = [cache.result_key(t, self, k) for t, k in zip(types, specs)]
+        out = [cache.get_result(i) for i in keys]
+        last = {}
+
+        def attach(i):
+            cls, attr = self._reduction(types[i])
+            if i >= last.get(attr, -1):
+                last[attr] = i
+                setattr(self, attr, out[i]._copy())
+
+        for i, t in enumerate(types):
+            cls, attr = self._reduction(t)
+            # Incremental PCA streams unscaled data so is run in this process
+            if out[i] is None and specs[i].get("method") == "Incremental":
+                out[i] = cls.analyse(self, **specs[i])
+                cache.put_result(keys[i], out[i])
+            if out[i] is not None:
+                attach(i)
+
+        todo = [i for i in range(len(specs)) if out[i] is None]
+        if len(todo) == 0:
+            return [i._copy() for i in out]
+
+        shared = {}
+        try:
+            with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+                futures = {}
+                for i in todo:
+                    scaling = specs[i].get("scaling", "zscore")
+                    if scaling not in shared:
+                        shared[scaling] = self._share_scaled(scaling)
+                    future = pool.submit(
+                        pydata._reduce_shared,
+                        types[i],
+                        specs[i],
+                        scaling,
+                        shared[scaling][0],
+                        self.description,
+                    )
+                    futures[future] = i
+                for future in as_completed(futures):
+                    i = futures[future]
+                    out[i] = pickle.loads(future.result())
+                    cache.put_result(keys[i], out[i])
+                    attach(i)
+        finally:
+            for _, shm in shared.values():
+                if shm is not None:
+                    shm.close()
+                    shm.unlink()
+        return [i._copy() for i in out]
+
+    def _share_scaled(self, scaling: str):
+        """Scaled data for worker processes with shared memory block.
+
+        Returns a tuple of a dict describing the scaled data for
+        pydata._reduce_shared and the shared memory block. Sparse data are
+        passed to workers directly so have no shared memory block.
+        """
+        dat, scaler = drdata._scale(self, scaling)
+        spec = {"scaler": scaler, "index": self._index(), "columns": self._columns()}
+        if sp.issparse(dat):
+            return {**spec, "data": dat, "name": None}, None
+        arr = np.asarray(dat)
+        shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+        np.ndarray(arr.shape, arr.dtype, buffer=shm.buf)[:] = arr
+        spec = {**spec, "name": shm.name, "shape": arr.shape, "dtype": arr.dtype.str}
+        return spec, shm
+
+    @staticmethod
+    def _reduce_shared(type: str, kwargs: dict, scaling: str, shared, description):
+        """Perform dimension reduction of scaled data in a worker process.
+
+        Returns the pickled result so that no references to the shared memory
+        block remain when it is closed.
+        """
+        cls = pydata._reduction(type)[0]
+        index, columns = shared["index"], shared["columns"]
+        shm = None
+        if shared["name"] is None:
+            dat = shared["data"]
+            view = _lview(dat.T, index, columns)
+        else:
+            shm = shared_memory.SharedMemory(name=shared["name"])
+            arr = np.ndarray(shared["shape"], np.dtype(shared["dtype"]), buffer=shm.buf)
+            dat = pd.DataFrame(arr, index=columns, columns=index, copy=False)
+            view = _lview(arr.T, index, columns)
+        x = pydata._from_view(
+            view, description, pd.DataFrame({"ID": index}), validation="off"
+        )
+        # Place scaled data in the scaling cache so analyse does not rescale
+        x._scale_cache = {(scaling, x._version): (dat, shared["scaler"])}
+        out = pickle.dumps(cls.analyse(x, **kwargs), protocol=pickle.HIGHEST_PROTOCOL)
+        if shm is not None:
+            del x, dat, arr, view
+            gc.collect()
+            shm.close()
+        return out
+
+    @staticmethod
+    def _reduction(type: str):
+        """Dimension reduction class and pydata attribute of type."""
         match type:
             case "pca":
-                self.pcs = pca.analyse(self, **kwargs)
+                return pca, "pcs"
             case "lda":
-                self.lda = lda.analyse(self, **kwargs)
+                return lda, "lda"
             case "tsne":
-                self.tsne = tsne.analyse(self, **kwargs)
+                return tsne, "tsne"
             case "umap":
-                self.umap = umap.analyse(self, **kwargs)
+                return umap, "umap"
             case _:
                 raise Exception(type + " dimension reduction not implemented")
 
+    def _reduce(self, cls, type: str, **kwargs):
+        """Perform dimension reduction, reusing cached results."""
+        key = cache.result_key(type, self, kwargs)
+        out = cache.get_result(key)
+        if out is None:
+            out = cls.analyse(self, **kwargs)
+            cache.put_result(key, out)
+        return out._copy()
+
+    def project(self, data: ldata, type: str = "pca"):
+        """Project new samples onto a dimension reduction.
+
+        Uses the scaler and model fitted by perform_dimension_reduction to
+        map new samples into an existing pca, lda or umap space without
+        refitting. See drdata.transform for details.
+
+        Parameters
+        ----------
+        data: ldata object
+            ldata object of new samples with the same features.
+        type: str
+            Type of dimension reduction. Either "pca", "lda" or "umap".
+            Default is "pca".
+
+        Returns
+        ----------
+        drdata object of the same type with new samples added.
+
+        Examples
+        ----------
+        >>> x = pydata.example_pydata()
+        >>> old = x.subset(samples=x.colnames[:100])
+        >>> old.perform_dimension_reduction("pca")
+        >>> old.project(x.subset(samples=x.colnames[100:]), "pca")
+        """
+        res = getattr(self, self._reduction(type)[1])
+        assert res is not None, type + " dimension reduction has not been performed"
+        return res.transform(data)
+
     def plot(self, type: str, **kwargs):
         """Plot pydata object.
 
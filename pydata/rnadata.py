@@ -1,10 +1,11 @@
 from pydata.pydata import pydata
 import pandas as pd
+import numpy as np
+import scipy.sparse as sp
 from rnanorm.datasets import load_toy_data, load_gtex
 from rnanorm import CPM, TPM, FPKM, UQ, CUF, TMM, CTF
 from pydeseq2.preprocessing import deseq2_norm
 import os
-from copy import deepcopy
 
 
 class rnadata(pydata):
@@ -46,6 +47,7 @@ class rnadata(pydata):
         gtf=None,
         filtering_method=None,
         normalisation_method=None,
+        validation=None,
     ):
         """
         Parameters
@@ -62,13 +64,16 @@ class rnadata(pydata):
         gtf: str
             Optional argument describing path to gtf file used to
             generate bulk RNAseq count data.
+        validation: str
+            Level of validation. Either "full", "fast" or "off". Default is
+            the pydata "validation" option.
         """
 
-        super().__init__(data, description, annotation)
+        super().__init__(data, description, annotation, validation)
         self._gtf = gtf
         self._filtering_method = filtering_method
         self._normalisation_method = normalisation_method
-        self._validate()
+        self._validate(validation)
 
     def __str__(self):
         out = super().__str__()
@@ -110,6 +115,14 @@ class rnadata(pydata):
 
     filtering_method = property(_get_filtering_method, _set_filtering_method)
 
+    def _metadata(self):
+        return {
+            **super()._metadata(),
+            "gtf": self.gtf,
+            "filtering_method": self.filtering_method,
+            "normalisation_method": self.normalisation_method,
+        }
+
     @staticmethod
     def example_rnadata(type: str = "toy", **kwargs):
         """Generate example rnadata.
@@ -145,20 +158,52 @@ class rnadata(pydata):
             str(dat.gtf_path),
         )
 
+    @classmethod
+    def from_csv(cls, path: str, gtf=None, filter_method: str = None, **kwargs):
+        """Read rnadata object from delimited count file
+
+        Reads count file in chunks, storing counts in the smallest integer
+        data type which fits and dropping features which fail filter_method
+        whilst reading. See ldata.from_csv for details.
+
+        Parameters
+        ----------
+        path: str
+            Path to delimited file of features (rows) by samples (columns).
+        gtf: str
+            Optional argument describing path to gtf file used to
+            generate bulk RNAseq count data.
+        filter_method: str
+            Method of filtering features. Either "sum", "mean" or "min".
+            Default is None for no filtering.
+        **kwargs:
+            Passed to ldata.from_csv.
+
+        Returns
+        ----------
+        rnadata object
+
+        Examples
+        ----------
+        >>> x = rnadata.example_rnadata()
+        >>> x.data.to_csv("counts.tsv", sep="\\t")
+        >>> rnadata.from_tsv("counts.tsv", filter_method="sum", thresh=10)
+        """
+        return super().from_csv(
+            path,
+            filter_method=filter_method,
+            gtf=gtf,
+            filtering_method=filter_method,
+            normalisation_method=None,
+            **kwargs,
+        )
+
     def filter_counts(self, method: str = "sum", thresh: int = 10, **kwargs):
         self._validate()
-        out = deepcopy(self)
-        match method:
-            case "sum":
-                keep = out.data.sum(axis=1) >= thresh
-            case "mean":
-                keep = out.data.mean(axis=1) >= thresh
-            case "min":
-                keep = out.data.min(axis=1) >= thresh
-            case _:
-                raise Exception(method + " filtering not implemented")
-        out = out.subset(features=keep[keep].index)
-        print(f"Dropping {self.data.shape[0] - len(keep)} features")
+        dat = self._matrix() if self.is_sparse else self.data
+        keep = self._filter_keep(dat, method, thresh)
+        out = self.subset(features=self._index()[keep])
+        print(f"Dropping {self._shape()[0] - keep.sum()} features")
         out.filtering_method = method
         return out
 
@@ -183,6 +228,10 @@ class rnadata(pydata):
         **kwargs:
             Passed to relevant method in rnanorm.
 
+        CPM normalisation of sparse rnadata objects keeps data sparse. Other
+        methods estimate normalisation factors on dense data before the
+        result is converted back to sparse data.
+
         Returns
         ----------
         rnadata object
@@ -193,8 +242,18 @@ class rnadata(pydata):
         >>> norm_x = x.normalise(method="CPM")
         """
         self._validate()
-        out = deepcopy(self)
-        in_data = out.data.transpose()
+        if self.is_sparse and method == "CPM":
+            dat = self._matrix()
+            lib_size = np.asarray(dat.sum(axis=0)).ravel()
+            out = self._copy_matrix(sp.csr_matrix(dat @ sp.diags(1e6 / lib_size)))
+            out.normalisation_method = method
+            return out
+
+        # Normalisation factors of other methods are estimated on dense data
+        x = self.to_dense() if self.is_sparse else self
+        # data is replaced below so is shared rather than copied
+        out = x._copy(data=x.data)
+        in_data = x.data.transpose()
         match method:
             case "TMM":
                 out.data = (
@@ -235,4 +294,6 @@ class rnadata(pydata):
             case _:
                 raise Exception(method + " normalisation not implemented")
         out.normalisation_method = method
+        if self.is_sparse:
+            out = out.to_sparse()
         return out
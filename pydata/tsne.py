@@ -2,6 +2,7 @@ from pydata.ldata import ldata
 from pydata.drdata import drdata
 import re
 import pandas as pd
+import scipy.sparse as sp
 from sklearn.manifold import TSNE
 
 
@@ -11,7 +12,7 @@ class tsne(drdata):
     (t-SNE)
     """
 
-    def __init__(self, data, description, annotation, scaling=None):
+    def __init__(self, data, description, annotation, scaling=None, validation=None):
         """
         Parameters
         ----------
@@ -23,8 +24,11 @@ class tsne(drdata):
             column names of data attribute.
         annotation: pandas.DataFrame
             A DataFrame of t-SNE components annotation.
+        validation: str
+            Level of validation. Either "full", "fast" or "off". Default is
+            the pydata "validation" option.
         """
-        super().__init__(data, description, annotation, scaling)
+        super().__init__(data, description, annotation, scaling, validation)
 
     @staticmethod
     def analyse(data, n_comp: int = 2, scaling: str = "zscore", **kwargs):
@@ -51,6 +55,8 @@ class tsne(drdata):
         >>> tnse.analyse(x)
         """
         dat = drdata.scale(data=data, method=scaling)
+        if sp.issparse(dat):
+            dat = dat.toarray()
         t = TSNE(n_components=n_comp, **kwargs)
         fit = t.fit_transform(dat)
         fit = pd.DataFrame(fit, columns=["TSNE" + str(i) for i in range(1, n_comp + 1)])
@@ -1,6 +1,7 @@
 from pydata.ldata import ldata
 from pydata.drdata import drdata
 import pandas as pd
+import scipy.sparse as sp
 from umap import UMAP
 import re
 
@@ -11,7 +12,7 @@ class umap(drdata):
     and projection (UMAP)
     """
 
-    def __init__(self, data, description, annotation, scaling=None):
+    def __init__(self, data, description, annotation, scaling=None, validation=None):
         """
         Parameters
         ----------
@@ -26,8 +27,11 @@ class umap(drdata):
         scaling: str
             String describing the scaling procedure used before UMAP e.g.
             zscore.
+        validation: str
+            Level of validation. Either "full", "fast" or "off". Default is
+            the pydata "validation" option.
         """
-        super().__init__(data, description, annotation, scaling)
+        super().__init__(data, description, annotation, scaling, validation)
 
     @staticmethod
     def analyse(data, n_comp: int = 2, scaling: str = "zscore", **kwargs):
@@ -53,7 +57,7 @@ class umap(drdata):
         >>> x = pydata.example_pydata()
         >>> umap.analyse(x)
         """
-        dat = drdata.scale(data=data, method=scaling)
+        dat, scaler = drdata._scale(data=data, method=scaling)
         u = UMAP(n_components=n_comp, random_state=42, **kwargs)
         fit = u.fit_transform(dat)
         fit = pd.DataFrame(fit, columns=["UMAP" + str(i) for i in range(1, n_comp + 1)])
@@ -64,4 +68,4 @@ class umap(drdata):
             annotation=pd.DataFrame(fit.columns.tolist(), columns=["ID"]),
             scaling=scaling,
         )
-        return out
+        return out._fitted(scaler, u, data._index(), sp.issparse(dat))
@@ -1,5 +1,6 @@
 import pytest
 from pydata.ldata import ldata
+from pydata.options import option_context
 from copy import deepcopy
 import numpy as np
 import pandas as pd
@@ -198,3 +199,206 @@ def test_concat(snapshot):
         pd.concat([a.description, b.description, c.description]).reset_index(drop=True)
     )
     snapshot.assert_match(str(x), "concat_ldata.txt")
+
+
+def test_copy_on_write():
+    x = ldata(data, desc, annot)
+    assert not np.shares_memory(x.data.values, data.values)
+
+    with option_context("copy_on_write", True):
+        x = ldata(data.astype(float), desc, annot)
+        t = x.transpose()
+        assert np.shares_memory(t.data.values, x.data.values)
+
+        t.data.iloc[0, 0] = -1
+        assert t.data.iloc[0, 0] == -1
+        assert x.data.iloc[0, 0] != -1
+
+        t.rownames = ["S" + str(i) for i in range(1, 6)]
+        assert x.colnames == data.columns.tolist()
+        assert x.description["ID"].tolist() == data.columns.tolist()
+
+    s = x.subset(features=["Feature1", "Feature2"])
+    s.rownames = ["A", "B"]
+    assert x.rownames == data.index.tolist()
+    assert x.annotation["ID"].tolist() == data.index.tolist()
+
+
+def test_subset_view():
+    x = ldata(data, desc, annot)
+    s = x.subset(samples=["Sample4", "Sample2", "Sample1"])
+    assert s._data is None
+    assert str(s) == "ldata object:\n - Dimensions: 3 (samples) x 20 (features)"
+    assert s.colnames == ["Sample4", "Sample2", "Sample1"]
+    assert s.description["ID"].tolist() == s.colnames
+
+    s = s.subset(samples=["Sample1", "Sample4"], features=["Feature2", "Feature7"])
+    assert s._data is None
+    assert s._view.block is not x.data
+    assert s._view.rows.tolist() == [1, 6]
+    assert s._view.cols.tolist() == [0, 3]
+    assert s.data.equals(data.loc[["Feature2", "Feature7"], ["Sample1", "Sample4"]])
+    assert s._view is None
+
+    t = x.subset(features=["Feature2", "Feature7"]).transpose()
+    assert t._data is None
+    assert t.data.equals(data.loc[["Feature2", "Feature7"]].transpose())
+
+    s = x.subset(features=["Feature2", "Feature7"])
+    s.rownames = ["A", "B"]
+    assert s._data is None
+    assert s.data.index.tolist() == ["A", "B"]
+
+
+def test_check_dimnames_cache():
+    x = ldata(data, desc, annot)
+    key = x._checked_dimnames
+    assert key[0] is x.data.index
+    x._validate()
+    assert x._checked_dimnames is key
+
+    x.rownames = ["F" + str(i) for i in range(1, 21)]
+    x._validate()
+    assert x._checked_dimnames is not key
+    assert x._checked_dimnames[0] is x.data.index
+
+    x._annotation = annot
+    with pytest.raises(AssertionError) as err:
+        x._validate()
+    assert "data rownames do not match annotation ID" in str(err.value)
+
+
+def test_validation():
+    bad_annot = annot.copy()
+    bad_annot["ID"] = ["F" + str(i) for i in range(1, 21)]
+
+    with pytest.raises(AssertionError) as err:
+        ldata(data, desc, bad_annot)
+    assert "data rownames do not match annotation ID" in str(err.value)
+
+    with pytest.raises(AssertionError) as err:
+        ldata(data, desc, annot, validation="some")
+    assert "validation must be 'full', 'fast' or 'off'" in str(err.value)
+
+    x = ldata(data, desc, bad_annot, validation="fast")
+    assert x.annotation["ID"].tolist() == bad_annot["ID"].tolist()
+
+    with pytest.raises(AssertionError) as err:
+        ldata(data, desc, annot.head(2), validation="fast")
+    assert "data rownames do not match annotation ID" in str(err.value)
+
+    tst = deepcopy(data)
+    tst.Sample1 = "a"
+    with pytest.raises(AssertionError) as err:
+        ldata(tst, desc, annot, validation="fast")
+    assert "data must all be numeric values" in str(err.value)
+
+    ldata(tst, desc, annot.head(2), validation="off")
+
+    with option_context("validation", "off"):
+        x = ldata(data, desc, bad_annot)
+        x.subset(samples=["Sample1"])
+    with pytest.raises(AssertionError) as err:
+        x.subset(samples=["Sample1"])
+    assert "data rownames do not match annotation ID" in str(err.value)
+
+
+def test_save_load(tmp_path):
+    x = ldata(data, desc, annot)
+    x.description = desc.assign(
+        Group=pd.Categorical(["A", "A", "B", "B", None]),
+        Label=["a", None, "c", "d", "e"],
+        Value=[1.5, 2.5, np.nan, 4.5, 5.5],
+    )
+    path = str(tmp_path / "x")
+    x.save(path)
+
+    with pytest.raises(AssertionError) as err:
+        x.save(path)
+    assert "already exists" in str(err.value)
+    x.save(path, overwrite=True)
+
+    l = ldata.load(path)
+    assert isinstance(l, ldata)
+    assert l._data is None
+    assert isinstance(l._view.block, np.memmap)
+    assert l.colnames == x.colnames
+    assert l.rownames == x.rownames
+    assert l.description.equals(x.description)
+    assert l.annotation.equals(x.annotation)
+
+    s = l.subset(samples=["Sample2", "Sample4"], features=["Feature3"])
+    assert s.data.equals(data.loc[["Feature3"], ["Sample2", "Sample4"]])
+
+    assert l.data.equals(data)
+    l.data.iloc[0, 0] = 100
+    assert ldata.load(path).data.iloc[0, 0] == data.iloc[0, 0]
+
+    l = ldata.load(path, mmap=False)
+    assert not isinstance(l._view.block, np.memmap)
+    assert l.data.equals(data)
+
+
+def test_from_csv(tmp_path):
+    path = str(tmp_path / "data.csv")
+    data.to_csv(path)
+
+    x = ldata.from_csv(path, chunksize=7)
+    assert isinstance(x, ldata)
+    assert x.data.dtypes.unique().tolist() == [np.uint8]
+    assert x.data.equals(data.astype(np.uint8))
+    assert x.description.equals(desc)
+    assert x.annotation.equals(annot)
+
+    with pytest.raises(Exception) as err:
+        ldata.from_csv(path, filter_method="custom")
+    assert "custom filtering not implemented" in str(err.value)
+
+    keep = data.mean(axis=1) >= 5
+    x = ldata.from_csv(path, annotation=annot, filter_method="mean", thresh=5)
+    assert x.rownames == keep[keep].index.tolist()
+    assert x.annotation["ID"].tolist() == keep[keep].index.tolist()
+
+    x = ldata.from_csv(path, filter_method="min", thresh=100)
+    assert x.data.shape == (0, 5)
+
+    path = str(tmp_path / "data.tsv")
+    (data / 2).to_csv(path, sep="\t")
+    x = ldata.from_tsv(path, description=desc, chunksize=3)
+    assert x.data.equals(data / 2)
+
+
+def test_sparse(tmp_path):
+    x = ldata(data, desc, annot).to_sparse()
+    assert x.is_sparse
+    assert x._matrix().format == "csr"
+    assert x.to_sparse(format="csc")._matrix().format == "csc"
+    with pytest.raises(Exception) as err:
+        x.to_sparse(format="coo")
+    assert "coo sparse format not implemented" in str(err.value)
+
+    assert isinstance(x.data.dtypes.iloc[0], pd.SparseDtype)
+    assert x.to_dense().data.equals(data)
+    assert not x.to_dense().is_sparse
+
+    s = ldata(data.astype(pd.SparseDtype("float64", 0)), desc, annot)
+    assert s.is_sparse
+    assert s.to_dense().data.equals(data.astype("float64"))
+
+    sub = x.subset(samples=["Sample2", "Sample4"], features=["Feature3"])
+    assert sub.is_sparse
+    assert sub.to_dense().data.equals(data.loc[["Feature3"], ["Sample2", "Sample4"]])
+    assert x.transpose().is_sparse
+    assert x.transpose().to_dense().data.equals(data.transpose())
+
+    y = ldata(data, desc, annot)
+    y.colnames = [f"New{i}" for i in range(1, 6)]
+    c = x.concat(y)
+    assert c.is_sparse
+    assert c.to_dense().data.equals(ldata(data, desc, annot).concat(y).data)
+
+    path = str(tmp_path / "x")
+    x.save(path)
+    l = ldata.load(path)
+    assert l.is_sparse
+    assert l.to_dense().data.equals(data)
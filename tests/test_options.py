@@ -0,0 +1,34 @@
+import pytest
+import pandas as pd
+from pydata.options import get_option, set_option, reset_option, option_context
+
+
+def test_options():
+    with pytest.raises(AssertionError) as err:
+        get_option("custom")
+    assert "custom is not a pydata option" in str(err.value)
+
+    with pytest.raises(AssertionError) as err:
+        set_option("copy_on_write", "yes")
+    assert "copy_on_write must be bool" in str(err.value)
+
+    assert get_option("copy_on_write") is False
+    set_option("copy_on_write", True)
+    assert get_option("copy_on_write") is True
+    assert pd.get_option("mode.copy_on_write") is True
+    reset_option("copy_on_write")
+    assert get_option("copy_on_write") is False
+    assert pd.get_option("mode.copy_on_write") is False
+
+    with option_context("copy_on_write", True):
+        assert get_option("copy_on_write") is True
+    assert get_option("copy_on_write") is False
+
+    with pytest.raises(AssertionError) as err:
+        set_option("validation", "some")
+    assert "validation must be 'full', 'fast' or 'off'" in str(err.value)
+
+    assert get_option("validation") == "full"
+    with option_context("validation", "off"):
+        assert get_option("validation") == "off"
+    assert get_option("validation") == "full"
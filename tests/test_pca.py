@@ -4,6 +4,7 @@ from pydata.pydata import pydata
 from copy import deepcopy
 import numpy as np
 import pandas as pd
+from sklearn.decomposition import PCA
 
 np.random.seed(38)
 pcs = pd.DataFrame(
@@ -144,3 +145,122 @@ def test_analyse(snapshot):
     assert isinstance(out, pca)
     snapshot.assert_match(str(out), "pca_print.txt")
     snapshot.assert_match(out.data.round(3).to_csv(), "pca_data.txt")
+
+
+def test_validation():
+    new_pcs = pcs.rename(index={"PCA1": "PC1"})
+    new_annot = deepcopy(annot)
+    new_annot["ID"] = new_pcs.index
+
+    with pytest.raises(AssertionError) as err:
+        pca(new_pcs, desc, new_annot)
+    assert "rownames must be in format PCA1, PCA2, etc" in str(err.value)
+
+    x = pca(new_pcs, desc, new_annot, validation="fast")
+    assert x.rownames[0] == "PC1"
+
+    with pytest.raises(AssertionError) as err:
+        pca(
+            pcs,
+            desc,
+            annot.drop(columns="Percentage variance explained"),
+            validation="fast",
+        )
+    assert "annotation must contain 'Percentage variance explained' column" in str(
+        err.value
+    )
+
+
+def test_sparse():
+    x = pydata.example_pydata()
+    out = pca.analyse(x.to_sparse(), scaling="none")
+    assert isinstance(out, pca)
+    assert out.colnames == x.colnames
+    assert out.annotation["Percentage variance explained"].gt(0).all()
+
+
+def test_solvers():
+    x = pydata.example_pydata()
+    ref = pca.analyse(x, method="SVD")
+    for method in ["Randomized", "ARPACK", "Covariance"]:
+        out = pca.analyse(x, method=method)
+        assert out.method == method
+        assert np.allclose(out.data.abs(), ref.data.abs(), atol=1e-6)
+        assert np.allclose(
+            out.annotation["Percentage variance explained"],
+            ref.annotation["Percentage variance explained"],
+        )
+
+    # iris data is tall and skinny
+    assert pca.analyse(x, method="auto").method == "Covariance"
+    assert pca._auto_method(np.zeros((100, 1000)), 2) == "Randomized"
+    assert pca._auto_method(np.zeros((100, 1000)), 90) == "SVD"
+    assert pca._auto_method(np.zeros((20, 30)), 2) == "SVD"
+
+    out = pca.analyse(x.to_sparse(), scaling="none", method="Covariance")
+    ref = pca.analyse(x, scaling="none", method="SVD")
+    assert np.allclose(out.data.abs(), ref.data.abs(), atol=1e-6)
+
+
+def test_incremental(tmp_path):
+    x = pydata.example_pydata()
+    ref = pca.analyse(x, n_comp=4)
+    out = pca.analyse(x, n_comp=4, method="Incremental", batch_size=40)
+    assert isinstance(out, pca)
+    assert out.method == "Incremental"
+    assert out.scaling == "zscore"
+    assert np.allclose(out.data.abs(), ref.data.abs(), atol=1e-6)
+    assert np.allclose(
+        out.annotation["Percentage variance explained"],
+        ref.annotation["Percentage variance explained"],
+    )
+
+    path = str(tmp_path / "x")
+    x.save(path)
+    l = pydata.load(path)
+    out = pca.analyse(l, n_comp=2, method="Incremental", batch_size=50)
+    ref = pca.analyse(x, n_comp=2)
+    assert np.allclose(out.data.abs(), ref.data.abs(), atol=0.1)
+
+    out = pca.analyse(x.to_sparse(), scaling="none", method="Incremental")
+    ref = pca.analyse(x, scaling="none")
+    assert np.allclose(out.data.abs(), ref.data.abs(), atol=0.1)
+
+    with pytest.raises(Exception) as err:
+        pca.analyse(x, scaling="custom", method="Incremental")
+    assert "custom scaling method not implemented" in str(err.value)
+
+
+def test_transform():
+    x = pydata.example_pydata()
+    old = x.subset(samples=x.colnames[:100])
+    new = x.subset(samples=x.colnames[100:])
+    for method in ["SVD", "Covariance", "Kernel", "Incremental"]:
+        pcs = pca.analyse(old, method=method)
+        out = pcs.transform(new)
+        assert isinstance(out, pca)
+        assert out.method == method
+        assert out.colnames == x.colnames
+        assert out.description.equals(x.description)
+        assert out.data.iloc[:, :100].equals(pcs.data)
+        if method in ["SVD", "Covariance"]:
+            ref = (old.data.T - old.data.T.mean()) / old.data.T.std(ddof=0)
+            new_z = (new.data.T - old.data.T.mean()) / old.data.T.std(ddof=0)
+            ref_model = PCA(n_components=2).fit(ref)
+            assert np.allclose(
+                np.abs(out.data.iloc[:, 100:].T), np.abs(ref_model.transform(new_z))
+            )
+
+    pcs = pca.analyse(old.to_sparse(), scaling="none")
+    out = pcs.transform(new)
+    assert out.data.shape == (2, 150)
+
+    with pytest.raises(AssertionError) as err:
+        pcs.transform(old)
+    assert "data samples are already in pca object" in str(err.value)
+    with pytest.raises(AssertionError) as err:
+        pcs.transform(new.subset(features=new.rownames[:2]))
+    assert "data must have same features as fitted data" in str(err.value)
+    with pytest.raises(AssertionError) as err:
+        pca(pcs.data, pcs.description, pcs.annotation).transform(new)
+    assert "pca object has no fitted model" in str(err.value)
@@ -1,8 +1,12 @@
 import pytest
+import os
 from pydata.pydata import pydata
 from pydata.pca import pca
 from pydata.lda import lda
 from pydata.tsne import tsne
+from pydata.drdata import drdata
+from pydata.options import _options, option_context
+from pydata import cache
 import numpy as np
 import pandas as pd
 
@@ -115,3 +119,182 @@ def test_transpose():
     assert l.lda is None
     assert x.colnames == data.columns.tolist()
     assert x.rownames == data.index.tolist()
+
+
+def test_save_load(tmp_path):
+    x = pydata(data, desc, annot)
+    x.perform_dimension_reduction("pca")
+    x.perform_dimension_reduction("lda", target="Treatment", n_comp=1)
+    path = str(tmp_path / "x")
+    x.save(path)
+
+    l = pydata.load(path)
+    assert isinstance(l, pydata)
+    assert l.data.equals(x.data)
+    assert isinstance(l.pcs, pca)
+    assert l.pcs.method == x.pcs.method
+    assert l.pcs.scaling == x.pcs.scaling
+    assert l.pcs.data.equals(x.pcs.data)
+    assert l.pcs.annotation.equals(x.pcs.annotation)
+    assert isinstance(l.lda, lda)
+    assert l.lda.target == "Treatment"
+    assert l.lda.data.equals(x.lda.data)
+    assert l.tsne is None
+
+
+def test_project():
+    x = pydata.example_pydata()
+    old = x.subset(samples=x.colnames[1::3] + x.colnames[2::3])
+    new = x.subset(samples=x.colnames[::3])
+    old.perform_dimension_reduction("pca")
+    old.perform_dimension_reduction("lda", target="Species")
+    old.perform_dimension_reduction("umap")
+    old.perform_dimension_reduction("tsne")
+
+    out = old.project(new, "pca")
+    assert isinstance(out, pca)
+    assert out.data.shape == (2, 150)
+    assert out.description["ID"].tolist()[100:] == new.colnames
+
+    out = old.project(new, "lda")
+    assert isinstance(out, lda)
+    assert (out.data.iloc[:, 100:].abs() > 0).all().all()
+
+    out = old.project(new, "umap")
+    assert out.data.shape == (2, 150)
+    assert not out.data.isna().any().any()
+
+    with pytest.raises(AssertionError) as err:
+        old.project(new, "tsne")
+    assert "tsne object has no fitted model" in str(err.value)
+    with pytest.raises(AssertionError) as err:
+        new.project(old, "pca")
+    assert "pca dimension reduction has not been performed" in str(err.value)
+    with pytest.raises(Exception) as err:
+        old.project(new, "custom")
+    assert "custom dimension reduction not implemented" in str(err.value)
+
+
+def test_scaling_cache(monkeypatch):
+    x = pydata.example_pydata()
+    calls = []
+    fit_scale = drdata._fit_scale
+    monkeypatch.setattr(
+        drdata,
+        "_fit_scale",
+        staticmethod(
+            lambda data, method: calls.append(method) or fit_scale(data, method)
+        ),
+    )
+    monkeypatch.setitem(_options, "result_cache_memory", 0)
+
+    x.perform_dimension_reduction("pca")
+    x.perform_dimension_reduction("lda", target="Species")
+    x.perform_dimension_reduction("umap")
+    assert calls == ["zscore"]
+    assert x._scaled("zscore") is x._scaled("zscore")
+    x.perform_dimension_reduction("pca", scaling="none")
+    assert calls == ["zscore", "none"]
+
+    s = x.subset(samples=x.colnames[:100])
+    assert s._scaled("zscore")[0].shape == (100, 4)
+    assert calls == ["zscore", "none", "zscore"]
+
+    x.data = x.data * 2
+    x.perform_dimension_reduction("pca")
+    assert calls == ["zscore", "none", "zscore", "zscore"]
+    assert list(x._scale_cache) == [("zscore", x._version)]
+
+    x.colnames = [f"New{i}" for i in range(150)]
+    assert x._scaled("zscore")[0].index.tolist() == x.colnames
+
+
+def test_result_cache(tmp_path, monkeypatch):
+    cache.clear_cache()
+    x = pydata.example_pydata()
+    calls = []
+    analyse = pca.analyse
+    monkeypatch.setattr(
+        pca,
+        "analyse",
+        staticmethod(
+            lambda data, **kwargs: calls.append(kwargs) or analyse(data, **kwargs)
+        ),
+    )
+
+    x.perform_dimension_reduction("pca")
+    first = x.pcs
+    x.perform_dimension_reduction("pca", n_comp=3)
+    x.perform_dimension_reduction("pca")
+    assert calls == [{}, {"n_comp": 3}]
+    assert x.pcs.data.equals(first.data)
+    assert x.pcs is not first
+
+    # Equal data in another object shares results
+    y = pydata.example_pydata()
+    y.perform_dimension_reduction("pca", n_comp=3)
+    assert len(calls) == 2
+
+    y.description = y.description.assign(Group="A")
+    y.perform_dimension_reduction("pca", n_comp=3)
+    assert len(calls) == 3
+
+    with option_context("result_cache_memory", 0):
+        x.perform_dimension_reduction("pca", n_comp=4)
+        x.perform_dimension_reduction("pca", n_comp=4)
+    assert len(calls) == 5
+
+    with option_context("result_cache_dir", str(tmp_path)):
+        x.perform_dimension_reduction("pca", n_comp=4)
+        assert len(os.listdir(tmp_path)) == 1
+        cache.clear_cache()
+        x.perform_dimension_reduction("pca", n_comp=4)
+        assert len(calls) == 6
+        assert x.pcs.model is not None
+        cache.clear_cache(disk=True)
+        assert len(os.listdir(tmp_path)) == 0
+
+    with pytest.raises(AssertionError) as err:
+        with option_context("result_cache_memory", -1):
+            pass
+    assert "result_cache_memory must be non-negative int" in str(err.value)
+
+
+def test_perform_dimension_reductions(monkeypatch):
+    cache.clear_cache()
+    x = pydata.example_pydata()
+    with pytest.raises(Exception) as err:
+        x.perform_dimension_reductions([{"type": "dr"}])
+    assert "dr dimension reduction not implemented" in str(err.value)
+
+    specs = [
+        {"type": "pca"},
+        {"type": "lda", "target": "Species"},
+        {"type": "tsne", "perplexity": 10, "random_state": 1},
+        {"type": "pca", "n_comp": 3, "scaling": "none"},
+        {"type": "pca", "method": "Incremental"},
+    ]
+    out = x.perform_dimension_reductions(specs, n_jobs=2)
+    assert [type(i) for i in out] == [pca, lda, tsne, pca, pca]
+    assert np.allclose(out[0].data, pca.analyse(x).data)
+    assert np.allclose(out[1].data, lda.analyse(x, target="Species").data)
+    assert np.allclose(
+        out[2].data, tsne.analyse(x, perplexity=10, random_state=1).data, atol=1e-4
+    )
+    assert np.allclose(out[3].data, pca.analyse(x, n_comp=3, scaling="none").data)
+    assert out[3].scaling == "none"
+    assert out[4].method == "Incremental"
+    assert x.pcs.data.equals(out[4].data)
+    assert x.lda.data.equals(out[1].data)
+    assert x.tsne.data.equals(out[2].data)
+    assert x.lda.model is not None
+
+    # Cached results are not recomputed
+    monkeypatch.setattr("pydata.pydata.ProcessPoolExecutor", None)
+    out = x.perform_dimension_reductions(specs[:1])
+    assert np.allclose(x.pcs.data, pca.analyse(x).data)
+
+    monkeypatch.undo()
+    s = x.to_sparse()
+    out = s.perform_dimension_reductions([{"type": "pca", "scaling": "none"}], n_jobs=1)
+    assert np.allclose(out[0].data, pca.analyse(s, scaling="none").data)
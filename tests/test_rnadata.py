@@ -76,3 +76,45 @@ def test_rnadata_normalisation(snapshot):
         norm_x = x.normalise(method=norm)
         assert isinstance(norm_x, rnadata)
         assert norm_x.normalisation_method == norm
+
+
+def test_save_load(tmp_path):
+    x = rnadata(data, desc, annot, gtf).filter_counts().normalise(method="CPM")
+    path = str(tmp_path / "x")
+    x.save(path)
+
+    l = rnadata.load(path)
+    assert isinstance(l, rnadata)
+    assert l.gtf == gtf
+    assert l.filtering_method == "sum"
+    assert l.normalisation_method == "CPM"
+    assert l.data.equals(x.data)
+
+
+def test_from_csv(tmp_path):
+    path = str(tmp_path / "counts.tsv")
+    data.to_csv(path, sep="\t")
+
+    x = rnadata.from_tsv(path, gtf=gtf, filter_method="sum", thresh=10, chunksize=3)
+    out = rnadata(data, desc, annot, gtf).filter_counts()
+    assert isinstance(x, rnadata)
+    assert x.gtf == gtf
+    assert x.filtering_method == "sum"
+    assert x.normalisation_method is None
+    assert x.rownames == out.rownames
+    assert x.data.equals(out.data.astype(x.data.dtypes.iloc[0]))
+
+
+def test_sparse():
+    x = rnadata(data, desc, annot, gtf)
+    s = x.to_sparse()
+    assert s.filter_counts().is_sparse
+    assert s.filter_counts().rownames == x.filter_counts().rownames
+
+    for norm in ["CPM", "TMM"]:
+        norm_s = s.normalise(method=norm)
+        assert norm_s.is_sparse
+        assert norm_s.normalisation_method == norm
+        assert np.allclose(
+            norm_s.to_dense().data, x.normalise(method=norm).data.astype(float)
+        )